@@ -1,17 +1,37 @@
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse
+import os
+import json
+from datetime import timedelta
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, HTTPException, UploadFile, File
+from fastapi.responses import HTMLResponse, StreamingResponse, FileResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from src.pipelines.prediction_pipeline import PredictionPipeline
+from src.pipelines.job_pipeline import JobWorkerPool, QueueFullError, TERMINAL_STATUSES
 from src.logger import logging
 from src.exception import CustomException
+import numpy as np
 import pandas as pd
-from app.schemas import TextRequest
+from app.schemas import TextRequest, JobSpec, ForecastRequest, BatchForecastRequest
 
-app = FastAPI(title="Wildfire Risk System")
+# Load model and preprocessor once, with drift monitoring of live requests
+pipeline = PredictionPipeline(enable_monitoring=True)
 
-# Load model and preprocessor once
-pipeline = PredictionPipeline()
+# Scoring jobs run in a pool of worker processes backed by a local SQLite queue
+worker_pool = JobWorkerPool()
+job_queue = worker_pool.queue
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    worker_pool.start()
+    yield
+    worker_pool.stop()
+
+
+app = FastAPI(title="Wildfire Risk System", lifespan=lifespan)
 
 # Static and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -82,3 +102,171 @@ async def predict_wildfire(data: TextRequest):
     except Exception as e:
         logging.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error.")
+
+
+def risk_curve(latitude: float, longitude: float, start_date, risk: np.ndarray) -> dict:
+    """Return the per-day risk curve of one location"""
+    dates = [(start_date + timedelta(days=d)).isoformat() for d in range(len(risk))]
+    peak = int(np.argmax(risk))
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "dates": dates,
+        "risk_probability": risk.tolist(),
+        "numeric_prediction": (risk > 0.5).astype(int).tolist(),
+        "peak_date": dates[peak],
+        "peak_risk": float(risk[peak]),
+    }
+
+
+@app.post("/forecast")
+def forecast_wildfire(data: ForecastRequest):
+    """Predict a daily wildfire risk curve for one location from a weather time series"""
+    try:
+        weather = np.asarray(data.weather, dtype=float)[np.newaxis]
+        risk = pipeline.predict_forecast([data.latitude], [data.longitude], data.start_date, weather)[0]
+        return risk_curve(data.latitude, data.longitude, data.start_date, risk)
+    except CustomException as e:
+        logging.error(f"Forecast failed: {e}")
+        raise HTTPException(status_code=500, detail="Model prediction failed.")
+    except Exception as e:
+        logging.error(f"Unexpected error: {e}")
+        raise HTTPException(status_code=500, detail="Internal Server Error.")
+
+
+@app.post("/forecast/batch")
+def forecast_wildfire_batch(data: BatchForecastRequest):
+    """Predict daily wildfire risk curves for many locations from a [location][day][variable] block"""
+    try:
+        weather = np.asarray(data.weather, dtype=float)
+        latitudes = [loc.latitude for loc in data.locations]
+        longitudes = [loc.longitude for loc in data.locations]
+        risk = pipeline.predict_forecast(latitudes, longitudes, data.start_date, weather)
+        return {
+            "start_date": data.start_date.isoformat(),
+            "horizon_days": weather.shape[1],
+            "forecasts": [
+                risk_curve(lat, lon, data.start_date, curve)
+                for lat, lon, curve in zip(latitudes, longitudes, risk)
+            ],
+        }
+    except CustomException as e:
+        logging.error(f"Batch forecast failed: {e}")
+        raise HTTPException(status_code=500, detail="Model prediction failed.")
+    except Exception as e:
+        logging.error(f"Unexpected error: {e}")
+        raise HTTPException(status_code=500, detail="Internal Server Error.")
+
+
+def _submitted(job_id: str) -> dict:
+    return {"job_id": job_id, "status": "queued", "status_url": f"/jobs/{job_id}"}
+
+
+@app.post("/jobs", status_code=202)
+def submit_spec_job(spec: JobSpec):
+    """Queue a scoring job for a bounding box and date range of the local weather data"""
+    try:
+        return _submitted(job_queue.submit_spec(spec.model_dump(mode="json")))
+    except QueueFullError:
+        raise HTTPException(status_code=429, detail="Job queue is full, try again later.")
+    except CustomException as e:
+        logging.error(f"Job submission failed: {e}")
+        raise HTTPException(status_code=500, detail="Job submission failed.")
+
+
+@app.post("/jobs/upload", status_code=202)
+def submit_file_job(file: UploadFile = File(...)):
+    """Queue a scoring job for an uploaded CSV of weather rows"""
+    try:
+        return _submitted(job_queue.submit_file(file.file))
+    except QueueFullError:
+        raise HTTPException(status_code=429, detail="Job queue is full, try again later.")
+    except CustomException as e:
+        logging.error(f"Job submission failed: {e}")
+        raise HTTPException(status_code=500, detail="Job submission failed.")
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    """Return progress and throughput stats of a job"""
+    status = job_queue.get_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return status
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job(job_id: str):
+    """Stream job progress as server-sent events until the job finishes"""
+    if await run_in_threadpool(job_queue.get_status, job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+
+    async def events():
+        while True:
+            status = await run_in_threadpool(job_queue.get_status, job_id)
+            yield f"data: {json.dumps(status)}\n\n"
+            if status["status"] in TERMINAL_STATUSES:
+                break
+            await asyncio.sleep(worker_pool.config.poll_interval)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _require_completed(job_id: str) -> None:
+    status = job_queue.get_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    if status["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Job is {status['status']}.")
+
+
+@app.get("/jobs/{job_id}/result")
+def get_job_result(job_id: str):
+    """Return the download URLs of the Parquet part files of a completed job"""
+    _require_completed(job_id)
+    parts = [f"/jobs/{job_id}/result/{part}" for part in job_queue.result_parts(job_id)]
+    return {"job_id": job_id, "format": "parquet", "parts": parts}
+
+
+@app.get("/jobs/{job_id}/result/{part}")
+def download_job_result_part(job_id: str, part: int):
+    """Download one Parquet part file of a completed job"""
+    _require_completed(job_id)
+    path = job_queue.result_part_path(job_id, part)
+    if part < 0 or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Result part not found.")
+    return FileResponse(path, media_type="application/vnd.apache.parquet", filename=f"{job_id}-part-{part:05d}.parquet")
+
+
+@app.delete("/jobs/{job_id}")
+def cancel_job(job_id: str):
+    """Cancel a job that has not finished yet"""
+    if job_queue.get_status(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    if not job_queue.cancel(job_id):
+        raise HTTPException(status_code=409, detail="Job has already finished.")
+    return {"job_id": job_id, "status": "cancelled"}
+
+
+def _require_monitor():
+    if pipeline.monitor is None:
+        raise HTTPException(status_code=503, detail="Monitoring is disabled: drift reference not found.")
+    return pipeline.monitor
+
+
+@app.get("/monitoring/drift")
+def get_drift_report():
+    """Return PSI/KS drift scores of live inputs against the training data, and prediction rates"""
+    monitor = _require_monitor()
+    try:
+        return monitor.report()
+    except CustomException as e:
+        logging.error(f"Drift report failed: {e}")
+        raise HTTPException(status_code=500, detail="Drift report failed.")
+
+
+@app.post("/monitoring/reset")
+def reset_monitoring():
+    """Clear the live monitoring sketches, e.g. after retraining"""
+    _require_monitor().reset()
+    return {"status": "reset"}
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, computed_field, model_validator
 from typing import Annotated
 from datetime import date
 
@@ -109,3 +109,62 @@ class TextRequest(BaseModel):
     @property
     def fm_diff(self) -> float:
         return self.fm100 - self.fm1000
+
+
+class JobSpec(BaseModel):
+    """Bounding box and date range to score from the local weather data."""
+    min_latitude: Annotated[float, Field(..., ge=-90, le=90, description="Southern edge of the bounding box")]
+    max_latitude: Annotated[float, Field(..., ge=-90, le=90, description="Northern edge of the bounding box")]
+    min_longitude: Annotated[float, Field(..., ge=-180, le=180, description="Western edge of the bounding box")]
+    max_longitude: Annotated[float, Field(..., ge=-180, le=180, description="Eastern edge of the bounding box")]
+    start_date: Annotated[date, Field(..., description="First day to score (inclusive)")]
+    end_date: Annotated[date, Field(..., description="Last day to score (inclusive)")]
+
+    @model_validator(mode="after")
+    def check_ranges(self):
+        if self.min_latitude > self.max_latitude or self.min_longitude > self.max_longitude:
+            raise ValueError("Bounding box minimums must not exceed maximums")
+        if self.start_date > self.end_date:
+            raise ValueError("start_date must not be after end_date")
+        return self
+
+
+MAX_FORECAST_DAYS = 31
+MAX_FORECAST_LOCATIONS = 1000
+N_WEATHER_VARIABLES = 15
+
+DailyWeather = Annotated[
+    list[float],
+    Field(
+        min_length=N_WEATHER_VARIABLES,
+        max_length=N_WEATHER_VARIABLES,
+        description="One day of weather: pr, rmax, rmin, sph, srad, tmmn, tmmx, vs, bi, fm100, fm1000, erc, etr, pet, vpd",
+    ),
+]
+WeatherSeries = Annotated[list[DailyWeather], Field(min_length=1, max_length=MAX_FORECAST_DAYS)]
+
+
+class ForecastRequest(BaseModel):
+    latitude: Annotated[float, Field(..., description="Latitude of the location in decimal degrees")]
+    longitude: Annotated[float, Field(..., description="Longitude of the location in decimal degrees")]
+    start_date: Annotated[date, Field(..., description="Date of the first forecast day")]
+    weather: Annotated[WeatherSeries, Field(..., description="Daily weather vectors, one per forecast day")]
+
+
+class ForecastLocation(BaseModel):
+    latitude: Annotated[float, Field(..., description="Latitude of the location in decimal degrees")]
+    longitude: Annotated[float, Field(..., description="Longitude of the location in decimal degrees")]
+
+
+class BatchForecastRequest(BaseModel):
+    locations: Annotated[list[ForecastLocation], Field(..., min_length=1, max_length=MAX_FORECAST_LOCATIONS)]
+    start_date: Annotated[date, Field(..., description="Date of the first forecast day")]
+    weather: Annotated[list[WeatherSeries], Field(..., description="Weather block shaped [location][day][variable]")]
+
+    @model_validator(mode="after")
+    def check_block_shape(self):
+        if len(self.weather) != len(self.locations):
+            raise ValueError("weather must have one daily series per location")
+        if len({len(series) for series in self.weather}) != 1:
+            raise ValueError("every location must have the same number of forecast days")
+        return self
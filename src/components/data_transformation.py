@@ -8,6 +8,8 @@ from sklearn.preprocessing import StandardScaler
 from imblearn.over_sampling import SMOTE
 from feature_engine.transformation import YeoJohnsonTransformer
 from feature_engine.outliers import Winsorizer
+from src.components.drift_monitor import DriftMonitoring
+from src.components.fire_proximity import FireProximity
 from src.logger import logging
 from src.exception import CustomException
 from src.utils import save_numpy_array_data, save_object, read_csv_file, read_yaml_file
@@ -40,6 +42,16 @@ class DataTransformation:
     def feature_engineering(self, df: pd.DataFrame) -> pd.DataFrame:
         try:
             df.drop_duplicates(ignore_index=True, inplace=True)
+            df = self.build_features(df)
+            df[self.target_column] = df[self.target_column].map({"No": 0, "Yes": 1})
+            return df
+        except Exception as e:
+            logging.error("Error in feature engineering")
+            raise CustomException(e, sys)
+
+    def build_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adds the calendar and derived weather features and drops the schema drop columns."""
+        try:
             df['datetime'] = pd.to_datetime(df['datetime'])
             df['year'] = df['datetime'].dt.year
             df['month'] = df['datetime'].dt.month
@@ -51,18 +63,18 @@ class DataTransformation:
             df['is_weekend'] = (df['dayofweek'] >= 5).astype(int)
             df['trange'] = df['tmmx'] - df['tmmn']
             df['rrange'] = df['rmax'] - df['rmin']
-            df['fm_ratio'] = df['fm100'] / df['fm1000']
+            # Zero denominators give 0.0 instead of inf, as in the API request features
+            df['fm_ratio'] = (df['fm100'] / df['fm1000']).where(df['fm1000'] != 0, 0.0)
             df['pet_minus_etr'] = df['pet'] - df['etr']
             df['trange_srad'] = df['trange'] * df['srad']
             df['vpd_tmmx'] = df['vpd'] * df['tmmx']
             df['fm_wind'] = df['fm100'] * df['vs']
-            df['pr_rmax_ratio'] = df['pr'] / df['rmax']
+            df['pr_rmax_ratio'] = (df['pr'] / df['rmax']).where(df['rmax'] != 0, 0.0)
             df['fm_diff'] = df['fm100'] - df['fm1000']
             df.drop(columns=self.drop_cols, inplace=True, errors='ignore')
-            df[self.target_column] = df[self.target_column].map({"No": 0, "Yes": 1})
             return df
         except Exception as e:
-            logging.error("Error in feature engineering")
+            logging.error("Error building features")
             raise CustomException(e, sys)
 
     def get_preprocessor_pipeline(self):
@@ -87,6 +99,16 @@ class DataTransformation:
             train_df = self.feature_engineering(train_df)
             test_df = self.feature_engineering(test_df)
 
+            logging.info("Building fire proximity index from training fires")
+            fire_index = FireProximity().initiate_fire_index(train_df, self.target_column)
+            train_df = fire_index.add_features(train_df)
+            test_df = fire_index.add_features(test_df)
+
+            # Rows without a full lookback window of earlier fire years would see a shorter history
+            train_df = train_df[fire_index.has_full_history(train_df["year"])].reset_index(drop=True)
+            test_df = test_df[fire_index.has_full_history(test_df["year"])].reset_index(drop=True)
+            logging.info(f"Kept rows with full fire history. Train: {train_df.shape}, Test: {test_df.shape}")
+
             X_train = train_df.drop(columns=[self.target_column], axis=1)
             y_train = train_df[self.target_column]
             X_test = test_df.drop(columns=[self.target_column], axis=1)
@@ -103,6 +125,9 @@ class DataTransformation:
             save_numpy_array_data(self.config.transformed_train_file_path, np.c_[X_train_transformed, y_train])
             save_numpy_array_data(self.config.transformed_test_file_path, np.c_[X_test_transformed, y_test])
             save_object(self.config.preprocessor_obj_file_path, preprocessor)
+
+            logging.info("Building drift monitoring reference from training features")
+            DriftMonitoring().initiate_drift_reference(X_train, y_train, preprocessor)
             
             logging.info(f"Data transformation completed and saved successfully at {self.config.preprocessor_obj_file_path}")
             return X_train_transformed, X_test_transformed, y_train, y_test
@@ -0,0 +1,307 @@
+# src/components/drift_monitor.py
+import os, sys
+import time
+import threading
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from src.logger import logging
+from src.exception import CustomException
+from src.utils import save_object
+
+REPORT_QUANTILES = (0.05, 0.5, 0.95)
+
+
+@dataclass
+class DriftMonitorConfig:
+    """Holds the reference path and sketch sizes for online drift monitoring."""
+    drift_reference_file_path: str = os.path.join("artifacts", "monitoring", "drift_reference.pkl")
+    n_bins: int = 10
+    n_grid_cells: int = 256
+    rate_bucket_seconds: int = 60
+    rate_n_buckets: int = 60
+    # Monotonic time features: live rows always fall after the training years, so PSI/KS
+    # would flag them on every request
+    unscored_features: tuple = ("year",)
+
+
+class DriftReference:
+    """
+    Per-feature summary of the training data the preprocessor was fitted on.
+
+    Every array has one row per feature so a whole request batch can be binned in a few
+    vectorized numpy calls. `bin_edges` are the training deciles used for PSI, the uniform
+    grid over the training range backs the quantile sketch and the KS statistic, and
+    `clip_low`/`clip_high` are the Winsorizer caps mapped back to raw feature space.
+    """
+    def __init__(self, X: pd.DataFrame, y: pd.Series, preprocessor, n_bins: int, n_grid_cells: int):
+        n_features = X.shape[1]
+        self.feature_names = list(X.columns)
+        self.n_rows = len(X)
+        self.n_grid_cells = n_grid_cells
+
+        quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+        self.bin_edges = X.quantile(quantiles).to_numpy().T
+        self.quantiles = X.quantile(REPORT_QUANTILES).to_numpy().T
+
+        # The Yeo-Johnson step is monotonic, so the Winsorizer quantile caps fitted on the
+        # transformed data are the same quantiles of the raw training data.
+        winsorizer = preprocessor.named_steps["winsorizer"]
+        fold = winsorizer.fold_
+        caps = X.quantile((fold, 1 - fold))
+        capped = X.columns.isin(winsorizer.variables_)
+        self.clip_low = np.where(capped, caps.loc[fold].to_numpy(), -np.inf)
+        self.clip_high = np.where(capped, caps.loc[1 - fold].to_numpy(), np.inf)
+
+        self.grid_lo = np.zeros(n_features)
+        self.grid_width = np.ones(n_features)
+        self.bin_props = np.zeros((n_features, n_bins))
+        self.grid_cdf = np.zeros((n_features, n_grid_cells + 2))
+        self.clip_low_rate = np.zeros(n_features)
+        self.clip_high_rate = np.zeros(n_features)
+        self.missing_rate = np.zeros(n_features)
+
+        # One column at a time keeps the temporaries at n_rows values instead of n_rows x n_features
+        for f, name in enumerate(self.feature_names):
+            column = X[name].to_numpy(dtype=float)
+            observed = column[~np.isnan(column)]
+            finite = observed[np.isfinite(observed)]
+            if len(finite):
+                self.grid_lo[f] = finite.min()
+                span = finite.max() - finite.min()
+                self.grid_width[f] = span / n_grid_cells if span > 0 else 1.0
+
+            bins = np.searchsorted(self.bin_edges[f], observed, side="right")
+            self.bin_props[f] = np.bincount(bins, minlength=n_bins) / max(len(observed), 1)
+            cells = self._grid_cells(f, observed)
+            self.grid_cdf[f] = np.cumsum(np.bincount(cells, minlength=n_grid_cells + 2)) / max(len(observed), 1)
+
+            self.clip_low_rate[f] = np.mean(column < self.clip_low[f]) if len(column) else 0.0
+            self.clip_high_rate[f] = np.mean(column > self.clip_high[f]) if len(column) else 0.0
+            self.missing_rate[f] = 1 - len(observed) / max(len(column), 1)
+
+        self.positive_rate = float(np.mean(y))
+
+    def _grid_cells(self, f: int, values: np.ndarray) -> np.ndarray:
+        scaled = (values - self.grid_lo[f]) / self.grid_width[f]
+        return np.clip(np.floor(scaled), -1, self.n_grid_cells).astype(np.int64) + 1
+
+    def count_grid(self, values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """Counts a live batch on the uniform grid, with an underflow and an overflow cell at each end."""
+        n_features, n_cells = values.shape[1], self.n_grid_cells + 2
+        scaled = (np.where(valid, values, 0.0) - self.grid_lo) / self.grid_width
+        cells = np.clip(np.floor(scaled), -1, self.n_grid_cells).astype(np.int64) + 1
+        flat = (cells + np.arange(n_features) * n_cells).ravel()
+        return np.bincount(flat, weights=valid.ravel(), minlength=n_features * n_cells).reshape(n_features, n_cells)
+
+
+def _bin_counts(values: np.ndarray, valid: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Bins a small live batch for all features at once; the reference is built per column instead."""
+    n_features, n_bins = values.shape[1], edges.shape[1] + 1
+    bins = (np.where(valid, values, 0.0)[:, :, None] >= edges[None, :, :]).sum(axis=2)
+    flat = (bins + np.arange(n_features) * n_bins).ravel()
+    return np.bincount(flat, weights=valid.ravel(), minlength=n_features * n_bins).reshape(n_features, n_bins)
+
+
+def _normalize(counts: np.ndarray) -> np.ndarray:
+    totals = counts.sum(axis=1, keepdims=True)
+    return counts / np.where(totals > 0, totals, 1.0)
+
+
+class DriftMonitor:
+    """
+    Constant-memory sketches of live model inputs and predictions.
+
+    `update` adds a request batch to fixed-size per-feature arrays (decile histogram,
+    quantile grid, clip, missing and min/max counters) and the prediction counter is a ring
+    of time buckets, so memory never grows with traffic. Drift scores are only computed
+    when `report` is called.
+    """
+    def __init__(self, reference: DriftReference, config: DriftMonitorConfig = DriftMonitorConfig()):
+        self.reference = reference
+        self.config = config
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        ref = self.reference
+        n_features = len(ref.feature_names)
+        with self._lock:
+            self.n_rows = 0
+            self.bin_counts = np.zeros((n_features, ref.bin_edges.shape[1] + 1))
+            self.grid_counts = np.zeros((n_features, ref.n_grid_cells + 2))
+            self.missing = np.zeros(n_features)
+            self.clip_low = np.zeros(n_features)
+            self.clip_high = np.zeros(n_features)
+            self.min = np.full(n_features, np.nan)
+            self.max = np.full(n_features, np.nan)
+            self.rate_bucket_ids = np.full(self.config.rate_n_buckets, -1, dtype=np.int64)
+            self.rate_counts = np.zeros(self.config.rate_n_buckets, dtype=np.int64)
+            self.rate_positives = np.zeros(self.config.rate_n_buckets, dtype=np.int64)
+            self.update_seconds = 0.0
+            self.n_updates = 0
+            self.started_at = time.time()
+
+    def _to_matrix(self, features: pd.DataFrame) -> np.ndarray:
+        if list(features.columns) != self.reference.feature_names:
+            features = features.reindex(columns=self.reference.feature_names)
+        return features.to_numpy(dtype=float)
+
+    def update(self, features: pd.DataFrame) -> None:
+        """Adds a batch of model input rows (before preprocessing) to the sketches."""
+        start = time.perf_counter()
+        ref = self.reference
+        values = self._to_matrix(features)
+        if len(values) == 0:
+            return
+        valid = ~np.isnan(values)
+
+        bin_counts = _bin_counts(values, valid, ref.bin_edges)
+        grid_counts = ref.count_grid(values, valid)
+        with self._lock:
+            self.n_rows += len(values)
+            self.bin_counts += bin_counts
+            self.grid_counts += grid_counts
+            self.missing += (~valid).sum(axis=0)
+            self.clip_low += (values < ref.clip_low).sum(axis=0)
+            self.clip_high += (values > ref.clip_high).sum(axis=0)
+            self.min = np.fmin(self.min, np.fmin.reduce(values, axis=0))
+            self.max = np.fmax(self.max, np.fmax.reduce(values, axis=0))
+            self.update_seconds += time.perf_counter() - start
+            self.n_updates += 1
+
+    def update_predictions(self, preds: np.ndarray) -> None:
+        """Adds a batch of 0/1 predictions to the rolling prediction-rate counter."""
+        bucket = int(time.time() // self.config.rate_bucket_seconds)
+        slot = bucket % self.config.rate_n_buckets
+        with self._lock:
+            if self.rate_bucket_ids[slot] != bucket:
+                self.rate_bucket_ids[slot] = bucket
+                self.rate_counts[slot] = 0
+                self.rate_positives[slot] = 0
+            self.rate_counts[slot] += len(preds)
+            self.rate_positives[slot] += int(np.sum(preds))
+
+    def _grid_quantiles(self, grid_counts: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Interpolates quantiles from the grid cells; the end cells span to the observed min/max."""
+        ref = self.reference
+        n_cells = ref.n_grid_cells
+        result = np.full((len(grid_counts), len(REPORT_QUANTILES)), np.nan)
+        for f, counts in enumerate(grid_counts):
+            total = counts.sum()
+            if total == 0:
+                continue
+            left = np.concatenate(([lo[f]], ref.grid_lo[f] + np.arange(n_cells + 1) * ref.grid_width[f]))
+            right = np.concatenate((left[1:], [max(hi[f], left[-1])]))
+            cum = np.cumsum(counts)
+            for i, q in enumerate(REPORT_QUANTILES):
+                target = q * total
+                cell = min(int(np.searchsorted(cum, target)), len(counts) - 1)
+                before = cum[cell] - counts[cell]
+                frac = (target - before) / counts[cell] if counts[cell] > 0 else 0.0
+                result[f, i] = left[cell] + frac * (right[cell] - left[cell])
+        return result
+
+    def report(self, eps: float = 1e-4) -> dict:
+        """Computes PSI/KS drift scores against the training reference plus the prediction rates."""
+        try:
+            ref = self.reference
+            with self._lock:
+                n_rows = self.n_rows
+                bin_counts = self.bin_counts.copy()
+                grid_counts = self.grid_counts.copy()
+                missing, clip_low, clip_high = self.missing.copy(), self.clip_low.copy(), self.clip_high.copy()
+                lo, hi = self.min.copy(), self.max.copy()
+                window_start = int(time.time() // self.config.rate_bucket_seconds) - self.config.rate_n_buckets
+                in_window = self.rate_bucket_ids > window_start
+                predictions = int(self.rate_counts[in_window].sum())
+                positives = int(self.rate_positives[in_window].sum())
+                update_seconds, n_updates = self.update_seconds, self.n_updates
+
+            live_props = np.clip(_normalize(bin_counts), eps, None)
+            ref_props = np.clip(ref.bin_props, eps, None)
+            psi = ((live_props - ref_props) * np.log(live_props / ref_props)).sum(axis=1)
+            ks = np.abs(np.cumsum(_normalize(grid_counts), axis=1) - ref.grid_cdf).max(axis=1)
+            quantiles = self._grid_quantiles(grid_counts, np.fmin(lo, ref.grid_lo), hi)
+            rows = max(n_rows, 1)
+
+            features = {}
+            for f, name in enumerate(ref.feature_names):
+                observed = n_rows - missing[f] > 0
+                scored = observed and name not in self.config.unscored_features
+                if not observed:
+                    status = "no_data"
+                elif not scored:
+                    status = "not_scored"
+                else:
+                    status = _drift_status(psi[f])
+                features[name] = {
+                    "psi": float(psi[f]) if scored else None,
+                    "ks": float(ks[f]) if scored else None,
+                    "status": status,
+                    "missing_rate": missing[f] / rows,
+                    "clip_low_rate": clip_low[f] / rows,
+                    "clip_high_rate": clip_high[f] / rows,
+                    "reference_clip_low_rate": float(ref.clip_low_rate[f]),
+                    "reference_clip_high_rate": float(ref.clip_high_rate[f]),
+                    "quantiles": _quantile_dict(quantiles[f]),
+                    "reference_quantiles": _quantile_dict(ref.quantiles[f]),
+                }
+
+            window_seconds = self.config.rate_bucket_seconds * self.config.rate_n_buckets
+            return {
+                "n_rows": n_rows,
+                "monitoring_since": self.started_at,
+                "mean_update_microseconds": 1e6 * update_seconds / n_updates if n_updates else 0.0,
+                "drifted_features": [name for name, stats in features.items() if stats["status"] == "drift"],
+                "predictions": {
+                    "window_seconds": window_seconds,
+                    "count": predictions,
+                    "per_second": predictions / window_seconds,
+                    "positive_rate": positives / predictions if predictions else None,
+                    "reference_positive_rate": ref.positive_rate,
+                },
+                "features": features,
+            }
+        except Exception as e:
+            logging.error("Error computing drift report")
+            raise CustomException(e, sys)
+
+
+def _quantile_dict(values: np.ndarray) -> dict:
+    return {str(q): (None if np.isnan(v) else float(v)) for q, v in zip(REPORT_QUANTILES, values)}
+
+
+def _drift_status(psi: float) -> str:
+    if psi >= 0.25:
+        return "drift"
+    if psi >= 0.1:
+        return "warning"
+    return "stable"
+
+
+class DriftMonitoring:
+    def __init__(self, config: DriftMonitorConfig = DriftMonitorConfig()):
+        """Initialize with a configuration object."""
+        self.config = config
+        os.makedirs(os.path.dirname(self.config.drift_reference_file_path), exist_ok=True)
+
+    def initiate_drift_reference(self, X_train: pd.DataFrame, y_train: pd.Series, preprocessor) -> DriftReference:
+        """
+        Summarises the training features the preprocessor was fitted on and saves the
+        reference used by DriftMonitor as a pickle file.
+        """
+        try:
+            logging.info("===== Drift Reference Build Started =====")
+            reference = DriftReference(
+                X_train, y_train, preprocessor,
+                n_bins=self.config.n_bins,
+                n_grid_cells=self.config.n_grid_cells,
+            )
+            save_object(self.config.drift_reference_file_path, reference)
+            logging.info(f"Drift reference saved at {self.config.drift_reference_file_path}")
+            return reference
+
+        except Exception as e:
+            logging.error("Error building drift reference")
+            raise CustomException(e, sys)
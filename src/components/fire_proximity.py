@@ -0,0 +1,190 @@
+# src/components/fire_proximity.py
+import os, sys
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from sklearn.neighbors import BallTree
+from src.logger import logging
+from src.exception import CustomException
+from src.utils import save_object
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+@dataclass
+class FireProximityConfig:
+    """Holds the index path and query parameters for the fire proximity features."""
+    fire_index_file_path: str = os.path.join("artifacts", "fire_proximity", "fire_index.pkl")
+    radius_km: float = 50.0
+    window_days: int = 15
+    max_distance_km: float = 1000.0
+    lookback_years: int = 2
+
+
+class FireProximityIndex:
+    """
+    Spatial index over historical fire events, keyed by lat/lon and day-of-year window.
+
+    Day of year is split into buckets of `window_days`. The tree for a bucket holds the
+    fires of that bucket and its two neighbours (wrapping around the year end), so a
+    query sees the fires within roughly +/- `window_days` of its own date.
+
+    Every row sees exactly the `lookback_years` years before its own year, so the features
+    mean the same thing for every training year and at serving time. Rows later than the
+    indexed history (the serving case) see the last `lookback_years` indexed years through
+    one merged tree per bucket; earlier rows sum the per-(bucket, year) trees of their window.
+    Training rows without a full window of earlier years must be dropped, see
+    `has_full_history`.
+    """
+    FIRE_COUNT_COL = "fire_count_radius"
+    NEAREST_FIRE_COL = "nearest_fire_km"
+
+    def __init__(self, radius_km: float, window_days: int, max_distance_km: float, lookback_years: int):
+        self.radius_km = radius_km
+        self.window_days = window_days
+        self.max_distance_km = max_distance_km
+        self.lookback_years = lookback_years
+        self.n_buckets = int(np.ceil(366 / window_days))
+        self.year_trees = {}
+        self.bucket_trees = {}
+        self.min_year = None
+        self.max_year = None
+        self.n_events = 0
+
+    def _bucket(self, dayofyear: np.ndarray) -> np.ndarray:
+        return (np.asarray(dayofyear, dtype=int) - 1) // self.window_days
+
+    @staticmethod
+    def _to_radians(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        return np.radians(np.column_stack([lat, lon]).astype(float))
+
+    def fit(self, lat: np.ndarray, lon: np.ndarray, dayofyear: np.ndarray, year: np.ndarray):
+        """Builds the merged per-bucket and the per-(bucket, year) trees from fire event coordinates."""
+        coords = self._to_radians(lat, lon)
+        buckets = self._bucket(dayofyear)
+        year = np.asarray(year, dtype=int)
+        if len(np.unique(year)) <= self.lookback_years:
+            raise ValueError(
+                f"Fire history spans {len(np.unique(year))} years, more than lookback_years={self.lookback_years} are needed"
+            )
+        self.min_year, self.max_year = int(year.min()), int(year.max())
+        latest = year > self.max_year - self.lookback_years
+
+        for b in range(self.n_buckets):
+            neighbours = [(b - 1) % self.n_buckets, b, (b + 1) % self.n_buckets]
+            in_window = np.isin(buckets, neighbours)
+            if not in_window.any():
+                continue
+            if (in_window & latest).any():
+                self.bucket_trees[b] = BallTree(coords[in_window & latest], metric="haversine")
+            window_coords, window_years = coords[in_window], year[in_window]
+            self.year_trees[b] = {
+                int(y): BallTree(window_coords[window_years == y], metric="haversine")
+                for y in np.unique(window_years)
+            }
+
+        self.n_events = len(coords)
+        return self
+
+    def has_full_history(self, year) -> np.ndarray:
+        """True for rows whose `lookback_years` previous years are all covered by the index."""
+        return np.asarray(year, dtype=int) - self.lookback_years >= self.min_year
+
+    def _window_end(self, year: np.ndarray) -> np.ndarray:
+        # Last year of each row's lookback window, clamped to the indexed history
+        return np.clip(year - 1, self.min_year + self.lookback_years - 1, self.max_year)
+
+    @staticmethod
+    def _query_tree(tree: BallTree, coords: np.ndarray, radius: float):
+        counts = tree.query_radius(coords, r=radius, count_only=True)
+        dist, _ = tree.query(coords, k=1)
+        return counts, dist[:, 0]
+
+    def transform(self, lat: np.ndarray, lon: np.ndarray, dayofyear: np.ndarray, year: np.ndarray):
+        """
+        Returns (fire count within `radius_km`, distance in km to the nearest past fire)
+        for every query row. Rows are grouped by bucket so each tree is queried once per batch.
+        """
+        coords = self._to_radians(lat, lon)
+        buckets = self._bucket(dayofyear)
+        window_end = self._window_end(np.asarray(year, dtype=int))
+        radius = self.radius_km / EARTH_RADIUS_KM
+
+        counts = np.zeros(len(coords), dtype=np.int64)
+        nearest = np.full(len(coords), np.inf)
+
+        for b in np.unique(buckets):
+            in_bucket = buckets == b
+
+            # Serving path: the window is the last indexed years, one merged tree suffices
+            latest = in_bucket & (window_end == self.max_year)
+            if latest.any() and b in self.bucket_trees:
+                c, d = self._query_tree(self.bucket_trees[b], coords[latest], radius)
+                counts[latest] = c
+                nearest[latest] = d
+
+            # Historical path: accumulate over the trees of the years in each row's window
+            historical = np.flatnonzero(in_bucket & (window_end < self.max_year))
+            if len(historical) == 0:
+                continue
+            for tree_year, tree in self.year_trees.get(b, {}).items():
+                ends = window_end[historical]
+                rows = historical[(tree_year <= ends) & (tree_year > ends - self.lookback_years)]
+                if len(rows) == 0:
+                    continue
+                c, d = self._query_tree(tree, coords[rows], radius)
+                counts[rows] += c
+                nearest[rows] = np.minimum(nearest[rows], d)
+
+        nearest_km = np.minimum(nearest * EARTH_RADIUS_KM, self.max_distance_km)
+        return counts, nearest_km
+
+    def add_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Appends the proximity feature columns to a DataFrame with latitude, longitude, dayofyear and year."""
+        counts, nearest_km = self.transform(
+            df["latitude"].to_numpy(),
+            df["longitude"].to_numpy(),
+            df["dayofyear"].to_numpy(),
+            df["year"].to_numpy(),
+        )
+        df[self.FIRE_COUNT_COL] = counts
+        df[self.NEAREST_FIRE_COL] = nearest_km
+        return df
+
+
+class FireProximity:
+    def __init__(self, config: FireProximityConfig = FireProximityConfig()):
+        """Initialize with a configuration object."""
+        self.config = config
+        os.makedirs(os.path.dirname(self.config.fire_index_file_path), exist_ok=True)
+
+    def initiate_fire_index(self, df: pd.DataFrame, target_column: str) -> FireProximityIndex:
+        """
+        Builds the fire proximity index from the positive events of a feature-engineered
+        DataFrame and saves it as a pickle file.
+        """
+        try:
+            logging.info("===== Fire Proximity Index Build Started =====")
+            fires = df[df[target_column] == 1]
+            logging.info(f"Indexing {len(fires)} historical fire events")
+
+            index = FireProximityIndex(
+                radius_km=self.config.radius_km,
+                window_days=self.config.window_days,
+                max_distance_km=self.config.max_distance_km,
+                lookback_years=self.config.lookback_years,
+            )
+            index.fit(
+                fires["latitude"].to_numpy(),
+                fires["longitude"].to_numpy(),
+                fires["dayofyear"].to_numpy(),
+                fires["year"].to_numpy(),
+            )
+
+            save_object(self.config.fire_index_file_path, index)
+            logging.info(f"Fire proximity index saved at {self.config.fire_index_file_path}")
+            return index
+
+        except Exception as e:
+            logging.error("Error building fire proximity index")
+            raise CustomException(e, sys)
@@ -0,0 +1,632 @@
+# src/pipelines/job_pipeline.py
+import os, sys
+import json
+import time
+import uuid
+import socket
+import glob
+import shutil
+import sqlite3
+import threading
+import multiprocessing as mp
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from threadpoolctl import threadpool_limits
+from src.logger import logging
+from src.exception import CustomException
+
+INPUT_COLUMNS = [
+    "latitude", "longitude", "datetime", "pr", "rmax", "rmin", "sph", "srad", "tmmn",
+    "tmmx", "vs", "bi", "fm100", "fm1000", "erc", "etr", "pet", "vpd",
+]
+KEY_COLUMNS = ["latitude", "longitude", "datetime"]
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+STARTUP_FAILURE_EXIT_CODE = 3
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while `max_queued_jobs` jobs are unfinished."""
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    spec TEXT,
+    status TEXT NOT NULL,
+    input_path TEXT,
+    output_dir TEXT NOT NULL,
+    total_rows INTEGER,
+    total_chunks INTEGER,
+    worker_pid INTEGER,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    job_id TEXT NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    n_rows INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_pid INTEGER,
+    not_before REAL,
+    started_at REAL,
+    finished_at REAL,
+    error TEXT,
+    PRIMARY KEY (job_id, chunk_index)
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_status ON chunks (status, job_id);
+CREATE TABLE IF NOT EXISTS pool_lease (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    owner TEXT NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class JobQueueConfig:
+    """Holds paths, chunking and concurrency limits for the asynchronous scoring jobs."""
+    jobs_dir: str = os.path.join("artifacts", "jobs")
+    db_path: str = os.path.join("artifacts", "jobs", "jobs.db")
+    weather_source_path: str = os.path.join("data", "Wildfire2M.csv")
+    chunk_size: int = 100_000
+    num_workers: int = 2
+    max_running_jobs: int = 2
+    max_queued_jobs: int = 20
+    max_chunk_attempts: int = 3
+    retry_backoff_seconds: float = 5.0
+    max_startup_failures: int = 3
+    poll_interval: float = 1.0
+    pool_lease_seconds: float = 30.0
+
+
+class JobQueue:
+    """
+    SQLite backed queue of scoring jobs.
+
+    A job is first prepared (its input is materialised as a Parquet file with one row group
+    per chunk) and then scored chunk by chunk. Chunk state lives in the database, so after a
+    crash only the chunks that were in flight are scored again.
+    """
+    def __init__(self, config: JobQueueConfig = JobQueueConfig()):
+        try:
+            self.config = config
+            os.makedirs(self.config.jobs_dir, exist_ok=True)
+            with closing(self._connect()) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA_SQL)
+        except Exception as e:
+            logging.error("Error initializing JobQueue")
+            raise CustomException(e, sys)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.config.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def acquire_pool_lease(self, owner: str) -> bool:
+        """
+        Makes `owner` the only worker pool of this queue, unless another pool has renewed
+        its lease within `pool_lease_seconds`.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            lease = conn.execute("SELECT owner, heartbeat_at FROM pool_lease WHERE id = 1").fetchone()
+            if lease is not None and lease["owner"] != owner and now - lease["heartbeat_at"] < self.config.pool_lease_seconds:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO pool_lease (id, owner, heartbeat_at) VALUES (1, ?, ?)", (owner, now)
+            )
+            return True
+
+    def renew_pool_lease(self, owner: str) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE pool_lease SET heartbeat_at = ? WHERE id = 1 AND owner = ?", (time.time(), owner)
+            )
+            return cursor.rowcount > 0
+
+    def release_pool_lease(self, owner: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM pool_lease WHERE id = 1 AND owner = ?", (owner,))
+
+    def job_dir(self, job_id: str) -> str:
+        return os.path.join(self.config.jobs_dir, job_id)
+
+    def _submit(self, kind: str, spec: dict = None, input_path: str = None, job_id: str = None) -> str:
+        """Inserts a queued job, checking `max_queued_jobs` in the same write transaction."""
+        job_id = job_id or uuid.uuid4().hex
+        output_dir = os.path.join(self.job_dir(job_id), "output")
+        os.makedirs(output_dir, exist_ok=True)
+        try:
+            with self._transaction() as conn:
+                pending = conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'preparing', 'running')"
+                ).fetchone()[0]
+                if pending >= self.config.max_queued_jobs:
+                    raise QueueFullError(f"{pending} unfinished jobs, the limit is {self.config.max_queued_jobs}")
+                conn.execute(
+                    "INSERT INTO jobs (id, kind, spec, status, input_path, output_dir, created_at) "
+                    "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                    (job_id, kind, json.dumps(spec) if spec else None, input_path, output_dir, time.time()),
+                )
+        except QueueFullError:
+            shutil.rmtree(self.job_dir(job_id), ignore_errors=True)
+            raise
+        logging.info(f"Job {job_id} ({kind}) queued")
+        return job_id
+
+    def submit_file(self, file_obj) -> str:
+        """Copies an uploaded CSV into the job directory and queues it for scoring."""
+        try:
+            job_id = uuid.uuid4().hex
+            os.makedirs(self.job_dir(job_id), exist_ok=True)
+            upload_path = os.path.join(self.job_dir(job_id), "upload.csv")
+            with open(upload_path, "wb") as out:
+                shutil.copyfileobj(file_obj, out)
+            return self._submit("file", input_path=upload_path, job_id=job_id)
+        except QueueFullError:
+            raise
+        except Exception as e:
+            logging.error("Error submitting file job")
+            raise CustomException(e, sys)
+
+    def submit_spec(self, spec: dict) -> str:
+        """Queues a bounding-box/date-range job scored from the local weather source."""
+        try:
+            return self._submit("spec", spec=spec)
+        except QueueFullError:
+            raise
+        except Exception as e:
+            logging.error("Error submitting spec job")
+            raise CustomException(e, sys)
+
+    def claim(self, worker_pid: int):
+        """
+        Claims the next unit of work for a worker: a pending chunk of a running job whose retry
+        backoff has passed, or else a queued job to prepare while fewer than `max_running_jobs`
+        jobs are active.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            chunk = conn.execute(
+                "SELECT c.job_id, c.chunk_index, j.input_path, j.output_dir "
+                "FROM chunks c JOIN jobs j ON j.id = c.job_id "
+                "WHERE c.status = 'pending' AND j.status = 'running' "
+                "AND (c.not_before IS NULL OR c.not_before <= ?) "
+                "ORDER BY j.created_at, c.chunk_index LIMIT 1",
+                (now,),
+            ).fetchone()
+            if chunk is not None:
+                conn.execute(
+                    "UPDATE chunks SET status = 'running', worker_pid = ?, started_at = ?, "
+                    "attempts = attempts + 1 WHERE job_id = ? AND chunk_index = ?",
+                    (worker_pid, now, chunk["job_id"], chunk["chunk_index"]),
+                )
+                return {"type": "chunk", **dict(chunk)}
+
+            active = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('preparing', 'running')"
+            ).fetchone()[0]
+            if active >= self.config.max_running_jobs:
+                return None
+
+            job = conn.execute(
+                "SELECT id AS job_id, kind, spec, input_path, output_dir FROM jobs "
+                "WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if job is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'preparing', worker_pid = ?, "
+                "started_at = COALESCE(started_at, ?) WHERE id = ?",
+                (worker_pid, now, job["job_id"]),
+            )
+            return {"type": "prepare", **dict(job)}
+
+    def complete_prepare(self, job_id: str, input_path: str, chunk_rows: list) -> None:
+        """Registers the chunks of a prepared job and starts scoring them."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO chunks (job_id, chunk_index, status, n_rows) VALUES (?, ?, 'pending', ?)",
+                [(job_id, i, n_rows) for i, n_rows in enumerate(chunk_rows)],
+            )
+            status = "running" if chunk_rows else "completed"
+            conn.execute(
+                "UPDATE jobs SET status = ?, input_path = ?, total_rows = ?, total_chunks = ?, "
+                "finished_at = ? WHERE id = ? AND status = 'preparing'",
+                (status, input_path, sum(chunk_rows), len(chunk_rows),
+                 now if status == "completed" else None, job_id),
+            )
+
+    def complete_chunk(self, job_id: str, chunk_index: int) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE chunks SET status = 'done', finished_at = ?, error = NULL "
+                "WHERE job_id = ? AND chunk_index = ?",
+                (now, job_id, chunk_index),
+            )
+            remaining = conn.execute(
+                "SELECT COUNT(*) FROM chunks WHERE job_id = ? AND status != 'done'", (job_id,)
+            ).fetchone()[0]
+            if remaining == 0:
+                conn.execute(
+                    "UPDATE jobs SET status = 'completed', finished_at = ? WHERE id = ? AND status = 'running'",
+                    (now, job_id),
+                )
+                logging.info(f"Job {job_id} completed")
+
+    def fail_chunk(self, job_id: str, chunk_index: int, error: str) -> None:
+        """
+        Puts a failed chunk back in the queue after an exponential backoff, or fails the job
+        once its attempts are used up.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            attempts = conn.execute(
+                "SELECT attempts FROM chunks WHERE job_id = ? AND chunk_index = ?", (job_id, chunk_index)
+            ).fetchone()[0]
+            status = "pending" if attempts < self.config.max_chunk_attempts else "failed"
+            not_before = now + self.config.retry_backoff_seconds * 2 ** (attempts - 1)
+            conn.execute(
+                "UPDATE chunks SET status = ?, error = ?, finished_at = ?, not_before = ? "
+                "WHERE job_id = ? AND chunk_index = ?",
+                (status, error, now, not_before, job_id, chunk_index),
+            )
+            if status == "failed":
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ? AND status = 'running'",
+                    (f"Chunk {chunk_index} failed after {attempts} attempts: {error}", now, job_id),
+                )
+
+    def fail_job(self, job_id: str, error: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? "
+                "WHERE id = ? AND status NOT IN ('completed', 'failed', 'cancelled')",
+                (error, time.time(), job_id),
+            )
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancels an unfinished job. Chunks already being scored are left to finish."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? "
+                "WHERE id = ? AND status NOT IN ('completed', 'failed', 'cancelled')",
+                (time.time(), job_id),
+            )
+            return cursor.rowcount > 0
+
+    def requeue(self, worker_pid: int = None) -> int:
+        """
+        Returns the in-flight work of a dead worker (or of every worker when `worker_pid` is
+        None) to the queue. Chunks that have used up their attempts fail their job instead.
+        """
+        now = time.time()
+        pid_filter, params = ("AND worker_pid = ?", (worker_pid,)) if worker_pid is not None else ("", ())
+        with self._transaction() as conn:
+            chunks = conn.execute(
+                "UPDATE chunks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END "
+                f"WHERE status = 'running' {pid_filter}",
+                (self.config.max_chunk_attempts, *params),
+            ).rowcount
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Worker crashed repeatedly on the same chunk', "
+                "finished_at = ? WHERE status = 'running' AND id IN (SELECT job_id FROM chunks WHERE status = 'failed')",
+                (now,),
+            )
+            jobs = conn.execute(
+                f"UPDATE jobs SET status = 'queued' WHERE status = 'preparing' {pid_filter}", params
+            ).rowcount
+        return chunks + jobs
+
+    def get_status(self, job_id: str):
+        """Returns progress and throughput stats of a job, or None if it does not exist."""
+        with closing(self._connect()) as conn:
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if job is None:
+                return None
+            done = conn.execute(
+                "SELECT COUNT(*) AS chunks_done, COALESCE(SUM(n_rows), 0) AS rows_done, "
+                "COALESCE(SUM(finished_at - started_at), 0.0) AS worker_seconds "
+                "FROM chunks WHERE job_id = ? AND status = 'done'",
+                (job_id,),
+            ).fetchone()
+
+        elapsed = 0.0
+        if job["started_at"] is not None:
+            elapsed = (job["finished_at"] or time.time()) - job["started_at"]
+        total_rows = job["total_rows"]
+        return {
+            "job_id": job["id"],
+            "kind": job["kind"],
+            "status": job["status"],
+            "error": job["error"],
+            "created_at": job["created_at"],
+            "total_rows": total_rows,
+            "total_chunks": job["total_chunks"],
+            "rows_done": done["rows_done"],
+            "chunks_done": done["chunks_done"],
+            "progress": done["rows_done"] / total_rows if total_rows else float(job["status"] == "completed"),
+            "elapsed_seconds": elapsed,
+            "rows_per_second": done["rows_done"] / elapsed if elapsed > 0 else 0.0,
+            "worker_seconds": done["worker_seconds"],
+            "rows_per_worker_second": done["rows_done"] / done["worker_seconds"] if done["worker_seconds"] > 0 else 0.0,
+        }
+
+    def result_part_path(self, job_id: str, part: int) -> str:
+        return os.path.join(self.job_dir(job_id), "output", f"part-{part:05d}.parquet")
+
+    def result_parts(self, job_id: str) -> list:
+        """Indices of the output part files written so far, one per scored chunk."""
+        paths = glob.glob(os.path.join(self.job_dir(job_id), "output", "part-*.parquet"))
+        return sorted(int(os.path.basename(path)[len("part-"):-len(".parquet")]) for path in paths)
+
+
+def _filter_spec(df: pd.DataFrame, spec: dict) -> pd.DataFrame:
+    dates = pd.to_datetime(df["datetime"])
+    mask = (
+        df["latitude"].between(spec["min_latitude"], spec["max_latitude"])
+        & df["longitude"].between(spec["min_longitude"], spec["max_longitude"])
+        & dates.between(pd.Timestamp(spec["start_date"]), pd.Timestamp(spec["end_date"]))
+    )
+    return df[mask]
+
+
+class JobWorker:
+    """Runs in a worker process: prepares queued jobs and scores their chunks with PredictionPipeline."""
+    def __init__(self, config: JobQueueConfig):
+        from src.components.data_transformation import DataTransformation
+        from src.components.fire_proximity import FireProximityIndex
+        from src.pipelines.prediction_pipeline import PredictionPipeline
+
+        self.config = config
+        self.queue = JobQueue(config)
+        self.transformation = DataTransformation()
+        self.pipeline = PredictionPipeline()
+        proximity_cols = (FireProximityIndex.FIRE_COUNT_COL, FireProximityIndex.NEAREST_FIRE_COL)
+        self.feature_cols = [c for c in self.transformation.num_cols if c not in proximity_cols]
+
+    def run(self, stop_event) -> None:
+        worker_pid = os.getpid()
+        logging.info(f"Job worker {worker_pid} started")
+        while not stop_event.is_set():
+            task = self.queue.claim(worker_pid)
+            if task is None:
+                stop_event.wait(self.config.poll_interval)
+            elif task["type"] == "prepare":
+                self.prepare(task)
+            else:
+                self.score_chunk(task)
+        logging.info(f"Job worker {worker_pid} stopped")
+
+    def prepare(self, task: dict) -> None:
+        """Materialises the job input as a Parquet file with one row group per chunk."""
+        job_id = task["job_id"]
+        try:
+            logging.info(f"Preparing job {job_id}")
+            if task["kind"] == "file":
+                frames = pd.read_csv(task["input_path"], chunksize=self.config.chunk_size)
+            else:
+                spec = json.loads(task["spec"])
+                frames = (
+                    _filter_spec(frame, spec)
+                    for frame in pd.read_csv(self.config.weather_source_path, chunksize=self.config.chunk_size)
+                )
+            input_path = os.path.join(self.queue.job_dir(job_id), "input.parquet")
+            chunk_rows = self._write_input(frames, input_path)
+            self.queue.complete_prepare(job_id, input_path, chunk_rows)
+            logging.info(f"Job {job_id} prepared: {sum(chunk_rows)} rows in {len(chunk_rows)} chunks")
+        except Exception as e:
+            logging.error(f"Error preparing job {job_id}: {e}")
+            self.queue.fail_job(job_id, str(e))
+
+    def _write_input(self, frames, input_path: str) -> list:
+        chunk_size = self.config.chunk_size
+        numeric = {c: "float64" for c in INPUT_COLUMNS if c != "datetime"}
+        writer, buffer, chunk_rows = None, [], []
+
+        def flush(block: pd.DataFrame):
+            nonlocal writer
+            table = pa.Table.from_pandas(block, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(input_path, table.schema)
+            writer.write_table(table, row_group_size=chunk_size)
+            chunk_rows.append(len(block))
+
+        try:
+            for frame in frames:
+                missing = set(INPUT_COLUMNS) - set(frame.columns)
+                if missing:
+                    raise ValueError(f"Input is missing columns: {sorted(missing)}")
+                frame = frame[INPUT_COLUMNS].astype(numeric)
+                frame["datetime"] = frame["datetime"].astype(str)
+                buffer.append(frame)
+                while sum(len(f) for f in buffer) >= chunk_size:
+                    block = pd.concat(buffer, ignore_index=True)
+                    flush(block.iloc[:chunk_size])
+                    buffer = [block.iloc[chunk_size:]]
+            rest = [f for f in buffer if len(f)]
+            if rest:
+                flush(pd.concat(rest, ignore_index=True))
+        finally:
+            if writer is not None:
+                writer.close()
+        return chunk_rows
+
+    def score_chunk(self, task: dict) -> None:
+        """Scores one row group and writes it atomically to its own output part file."""
+        job_id, chunk_index = task["job_id"], task["chunk_index"]
+        try:
+            df = pq.ParquetFile(task["input_path"]).read_row_group(chunk_index).to_pandas()
+            keys = df[KEY_COLUMNS].copy()
+            features = self.transformation.build_features(df)[self.feature_cols]
+            proba = self.pipeline.predict_proba(features)
+            result = keys.assign(risk_probability=proba, prediction=(proba > 0.5).astype(int))
+
+            part_path = self.queue.result_part_path(job_id, chunk_index)
+            tmp_path = f"{part_path}.tmp"
+            result.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, part_path)
+            self.queue.complete_chunk(job_id, chunk_index)
+        except Exception as e:
+            logging.error(f"Error scoring chunk {chunk_index} of job {job_id}: {e}")
+            self.queue.fail_chunk(job_id, chunk_index, str(e))
+
+
+def run_worker(config: JobQueueConfig, stop_event) -> None:
+    """
+    Worker process entry point. Model threads are split evenly between the workers.
+    Exits with STARTUP_FAILURE_EXIT_CODE when the worker cannot load its pipeline.
+    """
+    try:
+        worker = JobWorker(config)
+    except Exception as e:
+        logging.error(f"Job worker {os.getpid()} failed to start: {e}")
+        sys.exit(STARTUP_FAILURE_EXIT_CODE)
+    try:
+        threads = max(1, (os.cpu_count() or 1) // config.num_workers)
+        with threadpool_limits(limits=threads):
+            worker.run(stop_event)
+    except Exception as e:
+        logging.error(f"Job worker {os.getpid()} crashed: {e}")
+
+
+class JobWorkerPool:
+    """
+    Starts the worker processes, restarts the ones that die and requeues their work.
+
+    Only one pool may serve a queue. The pool holds a lease in the database, renewed by its
+    supervisor thread, and only requeues in-flight work once it owns the lease. A pool started
+    while another one holds the lease stays on standby and takes over once that lease goes
+    stale, e.g. when the previous API process was killed, so the worker count stays global.
+    """
+    def __init__(self, config: JobQueueConfig = JobQueueConfig()):
+        self.config = config
+        self.queue = JobQueue(config)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._ctx = mp.get_context("spawn")
+        self._stop_event = self._ctx.Event()
+        self._workers = []
+        self._supervisor = None
+        self._startup_failures = 0
+        self.started = False
+        self.active = False
+
+    def _spawn(self):
+        process = self._ctx.Process(target=run_worker, args=(self.config, self._stop_event), daemon=True)
+        process.start()
+        return process
+
+    def start(self) -> bool:
+        """
+        Starts the pool. Returns whether it owns the queue right away; otherwise its supervisor
+        thread waits on standby for the other pool's lease to go stale.
+        """
+        try:
+            owns_queue = self.queue.acquire_pool_lease(self.owner)
+            if owns_queue:
+                self._take_over()
+            else:
+                logging.info("Another job worker pool owns the queue, waiting on standby in this process")
+            self._supervisor = threading.Thread(target=self._supervise, daemon=True)
+            self._supervisor.start()
+            self.started = True
+            return owns_queue
+        except Exception as e:
+            logging.error("Error starting job worker pool")
+            raise CustomException(e, sys)
+
+    def _take_over(self) -> None:
+        """Requeues the work left in flight by the previous lease owner and starts the workers."""
+        recovered = self.queue.requeue()
+        logging.info(f"Recovered {recovered} interrupted chunks/jobs from the previous run")
+        self._workers = [self._spawn() for _ in range(self.config.num_workers)]
+        self.active = True
+        logging.info(f"Job worker pool {self.owner} started with {self.config.num_workers} workers")
+
+    def _supervise(self) -> None:
+        while not self.active:
+            if self._stop_event.wait(self.config.poll_interval):
+                return
+            if self.queue.acquire_pool_lease(self.owner):
+                logging.info(f"Job worker pool {self.owner} took over the queue from a stale pool")
+                self._take_over()
+
+        while not self._stop_event.wait(self.config.poll_interval * 5):
+            if not self.queue.renew_pool_lease(self.owner):
+                logging.error(f"Job worker pool {self.owner} lost its lease, stopping workers")
+                self._stop_event.set()
+                return
+            for i, process in enumerate(self._workers):
+                if process is None or process.is_alive():
+                    continue
+                self.queue.requeue(process.pid)
+                if process.exitcode == STARTUP_FAILURE_EXIT_CODE:
+                    self._startup_failures += 1
+                    if self._startup_failures >= self.config.max_startup_failures:
+                        logging.error(
+                            f"Job workers failed to start {self._startup_failures} times in a row, not restarting. "
+                            "Check the model artifacts and restart the pool."
+                        )
+                        self._workers[i] = None
+                        continue
+                else:
+                    self._startup_failures = 0
+                logging.warning(f"Job worker {process.pid} died, requeueing its work and restarting")
+                self._workers[i] = self._spawn()
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Lets workers finish their current chunk, then terminates the stragglers."""
+        if not self.started:
+            return
+        self._stop_event.set()
+        if self._supervisor is not None:
+            self._supervisor.join()
+        for process in self._workers:
+            if process is None:
+                continue
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+                self.queue.requeue(process.pid)
+        self.queue.release_pool_lease(self.owner)
+        self.started = False
+        self.active = False
+        logging.info("Job worker pool stopped")
+
+
+if __name__ == "__main__":
+    pool = JobWorkerPool()
+    if pool.start():
+        print(f"🚀 Job worker pool running with {pool.config.num_workers} workers. Press Ctrl+C to stop.")
+    else:
+        print("⏳ Another job worker pool is serving this queue, waiting on standby. Press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pool.stop()
+        print("✅ Job worker pool stopped.")
@@ -4,20 +4,80 @@ import pandas as pd
 from src.logger import logging
 from src.exception import CustomException
 from src.utils import load_object
+from src.components.data_transformation import DataTransformation
+from src.components.drift_monitor import DriftMonitor
+from src.components.fire_proximity import FireProximityIndex
+
+# Order of the variables in each daily weather vector of a forecast block
+WEATHER_VARIABLES = [
+    "pr", "rmax", "rmin", "sph", "srad", "tmmn", "tmmx", "vs",
+    "bi", "fm100", "fm1000", "erc", "etr", "pet", "vpd",
+]
+
+
+def build_forecast_frame(latitudes, longitudes, start_date, weather: np.ndarray) -> pd.DataFrame:
+    """
+    Lays out a forecast block as raw rows, one per location and day, ready for feature engineering.
+    Rows are ordered location-major, so row `i * horizon + d` is location i on day d.
+    Args:
+        latitudes, longitudes (array-like): Coordinates of the L locations.
+        start_date (date): Date of the first forecast day.
+        weather (np.ndarray): Daily weather of shape (L, H, len(WEATHER_VARIABLES)).
+    Returns:
+        pd.DataFrame: L * H rows with latitude, longitude, datetime and the weather variables.
+    """
+    n_locations, horizon, _ = weather.shape
+    frame = pd.DataFrame({
+        "latitude": np.repeat(np.asarray(latitudes, dtype=float), horizon),
+        "longitude": np.repeat(np.asarray(longitudes, dtype=float), horizon),
+        "datetime": np.tile(pd.date_range(start_date, periods=horizon, freq="D"), n_locations),
+    })
+    weather_cols = pd.DataFrame(weather.reshape(n_locations * horizon, -1).astype(float), columns=WEATHER_VARIABLES)
+    return pd.concat([frame, weather_cols], axis=1)
 
 
 class PredictionPipeline:
-    def __init__(self):
+    def __init__(self, enable_monitoring: bool = False):
         """
         Initializes the prediction pipeline by loading the preprocessor and trained model.
+        With `enable_monitoring`, every batch also updates a DriftMonitor over the training reference.
         """
         try:
             preprocessor_path = os.path.join("artifacts", "data_transformation", "preprocessor.pkl")
             model_path = os.path.join("artifacts", "model_trainer", "histgbm.pkl")
+            fire_index_path = os.path.join("artifacts", "fire_proximity", "fire_index.pkl")
 
             # Load preprocessor and model
             self.preprocessor = load_object(preprocessor_path)
             self.model = load_object(model_path)
+            self.transformation = DataTransformation()
+
+            # The fire proximity index is only needed by preprocessors trained with its features
+            expected = list(getattr(self.preprocessor, "feature_names_in_", []))
+            self.fire_index = None
+            if FireProximityIndex.FIRE_COUNT_COL in expected:
+                if not os.path.exists(fire_index_path):
+                    raise FileNotFoundError(
+                        f"Preprocessor expects fire proximity features but {fire_index_path} is missing. "
+                        "Re-run the training pipeline to rebuild all artifacts."
+                    )
+                self.fire_index = load_object(fire_index_path)
+            else:
+                logging.warning(
+                    "⚠️ Preprocessor was trained without fire proximity features. "
+                    "Re-run the training pipeline to enable them."
+                )
+
+            self.monitor = None
+            if enable_monitoring:
+                drift_reference_path = os.path.join("artifacts", "monitoring", "drift_reference.pkl")
+                if os.path.exists(drift_reference_path):
+                    self.monitor = DriftMonitor(load_object(drift_reference_path))
+                else:
+                    logging.warning(
+                        f"⚠️ Drift reference not found at {drift_reference_path}, monitoring is disabled. "
+                        "Re-run the training pipeline to enable it."
+                    )
 
             logging.info("✅ PredictionPipeline initialized successfully.")
         except Exception as e:
@@ -33,12 +93,12 @@ class PredictionPipeline:
             np.ndarray: Model predictions.
         """
         try:
-
-            logging.info("🔄 Transforming input features using preprocessor...")
-            transformed_features = self.preprocessor.transform(features)
+            transformed_features = self._transform(features)
 
             logging.info("🧠 Generating predictions using trained model...")
             preds = self.model.predict(transformed_features)
+            if self.monitor is not None:
+                self.monitor.update_predictions(preds)
 
             logging.info(f"✅ Predictions generated successfully. Shape: {preds.shape}")
             return preds
@@ -47,3 +107,57 @@ class PredictionPipeline:
             logging.error("❌ Error occurred during prediction.")
             raise CustomException(e, sys)
 
+    def predict_proba(self, features: pd.DataFrame) -> np.ndarray:
+        """
+        Transforms input features using the preprocessor and returns the wildfire probability.
+        Args:
+            features (pd.DataFrame): Raw feature DataFrame (same schema as training data).
+        Returns:
+            np.ndarray: Probability of the positive (wildfire) class for each row.
+        """
+        try:
+            transformed_features = self._transform(features)
+
+            logging.info("🧠 Generating wildfire probabilities using trained model...")
+            proba = self.model.predict_proba(transformed_features)[:, 1]
+            if self.monitor is not None:
+                self.monitor.update_predictions(proba > 0.5)
+
+            logging.info(f"✅ Probabilities generated successfully. Shape: {proba.shape}")
+            return proba
+
+        except Exception as e:
+            logging.error("❌ Error occurred during probability prediction.")
+            raise CustomException(e, sys)
+
+    def predict_forecast(self, latitudes, longitudes, start_date, weather: np.ndarray) -> np.ndarray:
+        """
+        Scores a multi-horizon forecast block with a single batched inference.
+        Args:
+            latitudes, longitudes (array-like): Coordinates of the L locations.
+            start_date (date): Date of the first forecast day.
+            weather (np.ndarray): Daily weather of shape (L, H, len(WEATHER_VARIABLES)).
+        Returns:
+            np.ndarray: Wildfire probability per location and day, shape (L, H).
+        """
+        try:
+            n_locations, horizon, _ = weather.shape
+            logging.info(f"📅 Building forecast features for {n_locations} locations x {horizon} days...")
+            frame = build_forecast_frame(latitudes, longitudes, start_date, weather)
+            features = self.transformation.build_features(frame)
+            return self.predict_proba(features).reshape(n_locations, horizon)
+
+        except Exception as e:
+            logging.error("❌ Error occurred during forecast prediction.")
+            raise CustomException(e, sys)
+
+    def _transform(self, features: pd.DataFrame) -> np.ndarray:
+        if self.fire_index is not None:
+            logging.info("📍 Looking up historical fire proximity features...")
+            features = self.fire_index.add_features(features.copy())
+        if self.monitor is not None:
+            self.monitor.update(features)
+
+        logging.info("🔄 Transforming input features using preprocessor...")
+        return self.preprocessor.transform(features)
+
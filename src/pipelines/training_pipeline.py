@@ -49,7 +49,7 @@ def run_training_pipeline(raw_data_path: str):
 if __name__ == "__main__":
     try:
         # --- Path to raw dataset ---
-        raw_data_path = r"C:\AI Pwskill\WildFire Risk\data\Wildfire2M.csv"
+        raw_data_path = os.path.join("data", "Wildfire2M.csv")
 
         from src.components.data_ingestion import DataIngestion, DataIngestionConfig
         from src.components.data_transformation import DataTransformation
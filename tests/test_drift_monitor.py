@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from feature_engine.outliers import Winsorizer
+from src.components.drift_monitor import DriftMonitor, DriftReference
+
+
+def make_monitor(X: pd.DataFrame) -> DriftMonitor:
+    preprocessor = Pipeline([("winsorizer", Winsorizer(capping_method="quantiles", tail="both", fold=0.05))])
+    preprocessor.fit(X)
+    y = pd.Series(np.zeros(len(X)))
+    return DriftMonitor(DriftReference(X, y, preprocessor, n_bins=10, n_grid_cells=64))
+
+
+def test_year_is_not_scored_for_drift():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({"year": rng.integers(2001, 2020, 5000).astype(float), "tmmx": rng.normal(300, 5, 5000)})
+    monitor = make_monitor(X)
+
+    # Live traffic is always dated after the training years
+    live = pd.DataFrame({"year": np.full(500, 2025.0), "tmmx": rng.normal(300, 5, 500)})
+    monitor.update(live)
+    report = monitor.report()
+
+    assert report["features"]["year"]["status"] == "not_scored"
+    assert report["features"]["year"]["psi"] is None
+    assert report["features"]["tmmx"]["status"] == "stable"
+    assert report["drifted_features"] == []
+
+
+def test_shifted_feature_is_reported_as_drift():
+    rng = np.random.default_rng(1)
+    X = pd.DataFrame({"year": rng.integers(2001, 2020, 5000).astype(float), "tmmx": rng.normal(300, 5, 5000)})
+    monitor = make_monitor(X)
+
+    monitor.update(pd.DataFrame({"year": np.full(500, 2025.0), "tmmx": rng.normal(315, 5, 500)}))
+    assert monitor.report()["drifted_features"] == ["tmmx"]
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from src.components.fire_proximity import EARTH_RADIUS_KM, FireProximityIndex
+
+RADIUS_KM = 100.0
+MAX_DISTANCE_KM = 1000.0
+LOOKBACK_YEARS = 2
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def brute_force(index, fires, lat, lon, dayofyear, year):
+    """Counts and nearest distance over the fires of each row's day window and lookback years."""
+    fire_lat, fire_lon, fire_doy, fire_year = fires
+    fire_bucket = index._bucket(fire_doy)
+    counts, nearest = [], []
+    for la, lo, doy, y in zip(lat, lon, dayofyear, year):
+        b = index._bucket(doy)
+        neighbours = [(b - 1) % index.n_buckets, b, (b + 1) % index.n_buckets]
+        end = min(max(y - 1, index.min_year + LOOKBACK_YEARS - 1), index.max_year)
+        window = np.isin(fire_bucket, neighbours) & (fire_year <= end) & (fire_year > end - LOOKBACK_YEARS)
+        dist = haversine_km(la, lo, fire_lat[window], fire_lon[window])
+        counts.append(int((dist <= RADIUS_KM).sum()))
+        nearest.append(min(dist.min(), MAX_DISTANCE_KM) if len(dist) else MAX_DISTANCE_KM)
+    return np.array(counts), np.array(nearest)
+
+
+@pytest.fixture
+def fitted():
+    rng = np.random.default_rng(0)
+    n = 3000
+    fires = (
+        rng.uniform(35, 40, n),
+        rng.uniform(-122, -116, n),
+        rng.integers(1, 367, n),
+        rng.integers(2010, 2016, n),
+    )
+    index = FireProximityIndex(
+        radius_km=RADIUS_KM, window_days=15, max_distance_km=MAX_DISTANCE_KM, lookback_years=LOOKBACK_YEARS
+    ).fit(*fires)
+    return index, fires, rng
+
+
+def check(index, fires, lat, lon, dayofyear, year):
+    counts, nearest = index.transform(lat, lon, dayofyear, year)
+    expected_counts, expected_nearest = brute_force(index, fires, lat, lon, dayofyear, year)
+    np.testing.assert_array_equal(counts, expected_counts)
+    np.testing.assert_allclose(nearest, expected_nearest, rtol=1e-9, atol=1e-6)
+    return counts
+
+
+def test_historical_rows_match_brute_force(fitted):
+    index, fires, rng = fitted
+    n = 200
+    year = rng.integers(2012, 2016, n)
+    check(index, fires, rng.uniform(34, 41, n), rng.uniform(-123, -115, n), rng.integers(1, 367, n), year)
+
+
+def test_rows_after_indexed_history_match_brute_force(fitted):
+    index, fires, rng = fitted
+    n = 200
+    year = rng.integers(2016, 2030, n)
+    counts = check(index, fires, rng.uniform(34, 41, n), rng.uniform(-123, -115, n), rng.integers(1, 367, n), year)
+    assert counts.sum() > 0
+
+
+def test_year_end_buckets_wrap_around(fitted):
+    index, fires, rng = fitted
+    n = 100
+    # Early January rows must see late December fires and vice versa
+    dayofyear = np.concatenate([rng.integers(1, 8, n), rng.integers(360, 367, n)])
+    year = np.concatenate([rng.integers(2012, 2016, n), rng.integers(2016, 2020, n)])
+    check(index, fires, rng.uniform(35, 40, 2 * n), rng.uniform(-122, -116, 2 * n), dayofyear, year)
+
+    fire_lat, fire_lon, fire_doy, fire_year = fires
+    december = (fire_doy >= 355) & (fire_year == 2014)
+    lat, lon = fire_lat[december][:1], fire_lon[december][:1]
+    counts, nearest = index.transform(lat, lon, np.array([2]), np.array([2016]))
+    assert counts[0] >= 1 and nearest[0] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_rows_without_full_history_are_flagged(fitted):
+    index, _, _ = fitted
+    np.testing.assert_array_equal(
+        index.has_full_history(np.array([2010, 2011, 2012, 2020])), [False, False, True, True]
+    )
@@ -0,0 +1,194 @@
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.pipelines.job_pipeline import JobQueue, JobQueueConfig, JobWorkerPool, QueueFullError
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    def factory(**overrides):
+        config = JobQueueConfig(
+            jobs_dir=str(tmp_path / "jobs"),
+            db_path=str(tmp_path / "jobs" / "jobs.db"),
+            **overrides,
+        )
+        return JobQueue(config)
+    return factory
+
+
+def start_job(queue, chunk_rows, worker_pid=1):
+    job_id = queue.submit_spec({"min_latitude": 0})
+    task = queue.claim(worker_pid)
+    assert task["type"] == "prepare" and task["job_id"] == job_id
+    queue.complete_prepare(job_id, "input.parquet", chunk_rows)
+    return job_id
+
+
+def test_claim_respects_max_running_jobs(make_queue):
+    queue = make_queue(max_running_jobs=1)
+    first = queue.submit_spec({"a": 1})
+    queue.submit_spec({"b": 2})
+
+    assert queue.claim(1)["job_id"] == first
+    assert queue.claim(2) is None
+
+
+def test_concurrent_submissions_respect_max_queued_jobs(make_queue):
+    queue = make_queue(max_queued_jobs=3)
+
+    def submit(i):
+        try:
+            return queue.submit_spec({"i": i})
+        except QueueFullError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        accepted = [job_id for job_id in executor.map(submit, range(16)) if job_id]
+    assert len(accepted) == 3
+
+    with pytest.raises(QueueFullError):
+        queue.submit_file(io.BytesIO(b"latitude,longitude\n"))
+    job_dirs = [d for d in os.listdir(queue.config.jobs_dir) if os.path.isdir(queue.job_dir(d))]
+    assert sorted(job_dirs) == sorted(accepted)
+
+
+def test_chunks_complete_job_and_report_progress(make_queue):
+    queue = make_queue()
+    job_id = start_job(queue, [10, 5])
+
+    chunks = [queue.claim(2), queue.claim(3)]
+    assert [c["chunk_index"] for c in chunks] == [0, 1]
+    for chunk in chunks:
+        queue.complete_chunk(job_id, chunk["chunk_index"])
+
+    status = queue.get_status(job_id)
+    assert status["status"] == "completed"
+    assert status["rows_done"] == 15 and status["progress"] == 1.0
+
+
+def test_empty_job_completes_without_chunks(make_queue):
+    queue = make_queue()
+    job_id = start_job(queue, [])
+    assert queue.get_status(job_id)["status"] == "completed"
+
+
+def test_failed_chunk_waits_for_backoff(make_queue):
+    queue = make_queue(retry_backoff_seconds=0.2)
+    job_id = start_job(queue, [10])
+
+    chunk = queue.claim(2)
+    queue.fail_chunk(job_id, chunk["chunk_index"], "transient")
+    assert queue.claim(2) is None
+
+    time.sleep(0.25)
+    retried = queue.claim(2)
+    assert retried["chunk_index"] == chunk["chunk_index"]
+
+
+def test_chunk_fails_job_after_max_attempts(make_queue):
+    queue = make_queue(max_chunk_attempts=2, retry_backoff_seconds=0)
+    job_id = start_job(queue, [10])
+
+    for _ in range(2):
+        chunk = queue.claim(2)
+        queue.fail_chunk(job_id, chunk["chunk_index"], "boom")
+
+    status = queue.get_status(job_id)
+    assert status["status"] == "failed"
+    assert "boom" in status["error"]
+    assert queue.claim(2) is None
+
+
+def test_requeue_only_returns_work_of_the_dead_worker(make_queue):
+    queue = make_queue()
+    start_job(queue, [10, 10])
+    queue.claim(2)
+    queue.claim(3)
+
+    assert queue.requeue(2) == 1
+    assert queue.claim(4)["chunk_index"] == 0
+    assert queue.claim(5) is None
+
+
+def test_requeue_all_recovers_preparing_jobs(make_queue):
+    queue = make_queue()
+    job_id = queue.submit_spec({"a": 1})
+    queue.claim(1)
+
+    assert queue.requeue() == 1
+    assert queue.get_status(job_id)["status"] == "queued"
+    assert queue.claim(2)["type"] == "prepare"
+
+
+def test_cancelled_job_chunks_are_not_claimed(make_queue):
+    queue = make_queue()
+    job_id = start_job(queue, [10])
+
+    assert queue.cancel(job_id)
+    assert not queue.cancel(job_id)
+    assert queue.claim(2) is None
+
+
+def test_pool_lease_is_exclusive_until_stale(make_queue):
+    queue = make_queue(pool_lease_seconds=0.2)
+
+    assert queue.acquire_pool_lease("a")
+    assert not queue.acquire_pool_lease("b")
+    assert queue.renew_pool_lease("a")
+
+    time.sleep(0.25)
+    assert queue.acquire_pool_lease("b")
+    assert not queue.renew_pool_lease("a")
+
+
+def test_pool_stops_respawning_workers_that_cannot_start(tmp_path, monkeypatch):
+    # Without artifacts in the working directory every worker fails to load its pipeline
+    monkeypatch.chdir(tmp_path)
+    config = JobQueueConfig(
+        jobs_dir=str(tmp_path / "jobs"),
+        db_path=str(tmp_path / "jobs" / "jobs.db"),
+        num_workers=1,
+        poll_interval=0.1,
+        max_startup_failures=2,
+    )
+    pool = JobWorkerPool(config)
+    assert pool.start()
+    try:
+        deadline = time.time() + 120
+        while pool._workers[0] is not None and time.time() < deadline:
+            time.sleep(0.2)
+        assert pool._workers[0] is None
+    finally:
+        pool.stop(timeout=5)
+    assert JobQueue(config).acquire_pool_lease("other")
+
+
+def test_standby_pool_takes_over_stale_lease(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = JobQueueConfig(
+        jobs_dir=str(tmp_path / "jobs"),
+        db_path=str(tmp_path / "jobs" / "jobs.db"),
+        num_workers=1,
+        poll_interval=0.1,
+        pool_lease_seconds=1.0,
+    )
+    # A pool that was killed without releasing its lease, with a chunk still in flight
+    queue = JobQueue(config)
+    assert queue.acquire_pool_lease("killed-pool")
+    start_job(queue, [10])
+    queue.claim(12345)
+
+    pool = JobWorkerPool(config)
+    assert not pool.start()
+    try:
+        assert not pool.active
+        deadline = time.time() + 30
+        while not pool.active and time.time() < deadline:
+            time.sleep(0.1)
+        assert pool.active
+        assert not queue.acquire_pool_lease("killed-pool")
+        assert queue.claim(2)["chunk_index"] == 0
+    finally:
+        pool.stop(timeout=5)
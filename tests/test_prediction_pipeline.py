@@ -0,0 +1,77 @@
+import os
+import shutil
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import HistGradientBoostingClassifier
+from app.schemas import TextRequest
+from src.components.data_transformation import DataTransformation
+from src.components.fire_proximity import FireProximity
+from src.pipelines.prediction_pipeline import PredictionPipeline, WEATHER_VARIABLES
+from src.utils import save_object
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def random_weather(rng, shape):
+    # Positive values on a plausible scale for every variable
+    scale = np.array([5, 100, 50, 0.01, 300, 290, 300, 5, 50, 15, 15, 50, 5, 5, 2])
+    return rng.uniform(0.1, 1.0, shape + (len(WEATHER_VARIABLES),)) * scale
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """A PredictionPipeline over small synthetic artifacts written to a temporary working directory."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("config")
+    shutil.copy(os.path.join(REPO_ROOT, "config", "schema.yaml"), os.path.join("config", "schema.yaml"))
+
+    rng = np.random.default_rng(0)
+    n = 3000
+    raw = pd.DataFrame({
+        "latitude": rng.uniform(35, 40, n),
+        "longitude": rng.uniform(-122, -116, n),
+        "datetime": pd.to_datetime("2018-01-01") + pd.to_timedelta(rng.integers(0, 5 * 365, n), unit="D"),
+    })
+    raw = pd.concat([raw, pd.DataFrame(random_weather(rng, (n,)), columns=WEATHER_VARIABLES)], axis=1)
+    raw["Wildfire"] = np.where(raw["tmmx"] + rng.normal(0, 40, n) > 180, "Yes", "No")
+
+    transformation = DataTransformation()
+    train_df = transformation.feature_engineering(raw)
+    fire_index = FireProximity().initiate_fire_index(train_df, transformation.target_column)
+    train_df = fire_index.add_features(train_df)
+    X = train_df.drop(columns=[transformation.target_column])
+    y = train_df[transformation.target_column]
+
+    preprocessor = transformation.get_preprocessor_pipeline()
+    model = HistGradientBoostingClassifier(max_iter=20, random_state=42).fit(preprocessor.fit_transform(X), y)
+    save_object(transformation.config.preprocessor_obj_file_path, preprocessor)
+    save_object(os.path.join("artifacts", "model_trainer", "histgbm.pkl"), model)
+    return PredictionPipeline()
+
+
+def test_forecast_block_matches_single_row_predictions(pipeline):
+    rng = np.random.default_rng(1)
+    n_locations, horizon = 3, 5
+    latitudes, longitudes = rng.uniform(35, 40, n_locations), rng.uniform(-122, -116, n_locations)
+    # Crosses the year end and includes a zero fm1000 to exercise the safe ratio
+    start_date = date(2024, 12, 29)
+    weather = random_weather(rng, (n_locations, horizon))
+    weather[1, 2, WEATHER_VARIABLES.index("fm1000")] = 0.0
+
+    risk = pipeline.predict_forecast(latitudes, longitudes, start_date, weather)
+    assert risk.shape == (n_locations, horizon)
+
+    for i in range(n_locations):
+        for d in range(horizon):
+            request = TextRequest(
+                latitude=latitudes[i],
+                longitude=longitudes[i],
+                datetime=start_date + timedelta(days=d),
+                **dict(zip(WEATHER_VARIABLES, weather[i, d])),
+            )
+            # Same single-row frame as the /predict endpoint builds
+            features = pd.DataFrame([request.model_dump(exclude={"datetime"})])
+            assert risk[i, d] == pytest.approx(pipeline.predict_proba(features)[0])
+    assert len(np.unique(risk)) > 1